@@ -3,9 +3,27 @@
 - Enum types are supported via the enum_values field, with individual values separated by the | character.
 """
 
-from collections import defaultdict
-import xml.etree.ElementTree as ET
+from collections import defaultdict, namedtuple
+from lxml import etree as ET
 import csv
+import io
+import multiprocessing
+import os
+import re
+import sys
+
+# below this many bytes of row data, pool startup costs more than it saves
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+# field definition keyed by element_name in fields_map; a namedtuple is
+# several times smaller than the per-row dicts it replaces
+FieldDef = namedtuple("FieldDef", ["element_type",
+                      "tag_number", "data_type", "enums"])
+
+# one enum_value:description pair, separators stripped, scanned in C;
+# each match is anchored to the start or a '|' so an empty code parses
+# the same way split(':', 1) did
+_ENUM_RE = re.compile(r"(?:^|\|)\s*([^:|]*?)\s*:\s*([^|]*?)\s*(?=\||$)")
 
 
 def parse_enum_values(enum_str, tag_number, errors):
@@ -16,6 +34,15 @@ def parse_enum_values(enum_str, tag_number, errors):
     enum_list = []
     if not enum_str:
         return enum_list
+
+    # happy path: every part has its ':', one findall scan does it all
+    part_count = enum_str.count("|") + 1
+    if enum_str.count(":") >= part_count:
+        matches = _ENUM_RE.findall(enum_str)
+        if len(matches) == part_count:
+            return matches
+
+    # slow path: malformed input, report per-part errors
     parts = enum_str.strip().split("|")
     for part in parts:
         if ":" not in part:
@@ -27,106 +54,222 @@ def parse_enum_values(enum_str, tag_number, errors):
     return enum_list
 
 
+try:
+    # compiled fast path, built via `python setup.py build_ext --inplace`
+    from _enum_parse import parse_enum_values
+except ImportError:
+    pass  # keep the pure-Python parser defined above
+
+
+# compiled chunk normalizers, one per distinct column layout
+_NORMALIZER_CACHE = {}
+
+
+def _compile_chunk_normalizer(indices):
+    """
+    codegen the row-normalizing loop with the column indices unrolled
+    as constants, so the hot loop carries no index indirection at all
+    """
+    normalize = _NORMALIZER_CACHE.get(indices)
+    if normalize is not None:
+        return normalize
+
+    (i_msg_type, i_msg_name, i_tag_number, i_element_name,
+     i_element_type, i_required, i_data_type, i_enum_values) = indices
+    enum_src = (f"row[{i_enum_values}].replace(' ', '').upper()"
+                if i_enum_values is not None else "''")
+    # the low-cardinality columns ("Y"/"N", "field"/"component", data
+    # types) take a handful of values; intern them so every row shares
+    # the same string objects
+    src = (
+        "def _normalize_chunk(reader, intern):\n"
+        "    return [(\n"
+        f"        row[{i_msg_type}].strip(),\n"
+        f"        row[{i_msg_name}].strip(),\n"
+        f"        row[{i_tag_number}].strip(),\n"
+        f"        row[{i_element_name}].strip(),\n"
+        f"        intern(row[{i_element_type}].strip()),\n"
+        f"        intern(row[{i_required}].strip().upper()),\n"
+        f"        intern(row[{i_data_type}].strip().upper()),\n"
+        f"        {enum_src},\n"
+        "    ) for row in reader if row]\n"  # skip blank lines like DictReader did
+    )
+    namespace = {}
+    exec(src, namespace)
+    normalize = namespace["_normalize_chunk"]
+    _NORMALIZER_CACHE[indices] = normalize
+    return normalize
+
+
+def _normalize_rows(args):
+    """
+    worker: csv-parse one byte range into normalized row tuples
+    """
+    csv_path, start, end, indices = args
+
+    with open(csv_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start).decode("utf-8")
+
+    normalize = _compile_chunk_normalizer(indices)
+    return normalize(csv.reader(io.StringIO(data, newline='')), sys.intern)
+
+
+def _contains_quote(csv_path, data_start, size):
+    """
+    block-scan the row data for a double quote; quoted fields may hold
+    embedded newlines, which byte-range chunking cannot split safely
+    """
+    with open(csv_path, "rb") as f:
+        f.seek(data_start)
+        remaining = size - data_start
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                break
+            if b'"' in block:
+                return True
+            remaining -= len(block)
+    return False
+
+
+def _split_byte_ranges(csv_path, data_start, size, n_chunks):
+    """
+    split [data_start, size) into n_chunks ranges aligned to newlines
+    """
+    bounds = [data_start]
+    chunk = (size - data_start) // n_chunks
+    with open(csv_path, "rb") as f:
+        for i in range(1, n_chunks):
+            f.seek(data_start + i * chunk)
+            f.readline()  # advance to the next row boundary
+            pos = f.tell()
+            if bounds[-1] < pos < size:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
 def csv_to_fix_xml(csv_path: str, output_xml_path: str):
     """
     generate fix documents from a CSV file
     """
     messages = defaultdict(list)
+    messages_seen = {}
     fields_map = {}
     errors = []
     duplicates = set()
 
-    with open(csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            msg_type = row["msg_type"].strip()
-            msg_name = row["msg_name"].strip()
-            tag_number = row["tag_number"].strip()
-            element_name = row["element_name"].strip()
-            element_type = row["element_type"].strip()
-            required = row["required"].strip().upper()
-            data_type = row["data_type"].strip().upper()
-            enum_raw = row.get("enum_values", "").replace(" ", "").upper()
-
-            if element_name in fields_map:
-                existing = fields_map[element_name]
-                if existing["element_name"] != element_name or existing["data_type"] != data_type or existing["tag_number"] != tag_number:
-                    errors.append(
+    with open(csv_path, "rb") as f:
+        header_line = f.readline()
+        data_start = f.tell()
+        size = f.seek(0, os.SEEK_END)
+
+    header = next(csv.reader([header_line.decode("utf-8")]))
+    idx = {name: i for i, name in enumerate(header)}
+    indices = (
+        idx["msg_type"],
+        idx["msg_name"],
+        idx["tag_number"],
+        idx["element_name"],
+        idx["element_type"],
+        idx["required"],
+        idx["data_type"],
+        idx.get("enum_values"),
+    )
+
+    # parse big CSVs in parallel, one byte range per worker; small files
+    # skip the pool and take the same code path serially, as do files
+    # containing quotes, whose records may span lines
+    n_workers = os.cpu_count() or 1
+    if (size - data_start >= _PARALLEL_MIN_BYTES and n_workers > 1
+            and not _contains_quote(csv_path, data_start, size)):
+        ranges = _split_byte_ranges(csv_path, data_start, size, n_workers)
+        tasks = [(csv_path, s, e, indices) for s, e in ranges]
+        with multiprocessing.Pool(len(tasks)) as pool:
+            chunks = pool.map(_normalize_rows, tasks)
+    else:
+        chunks = [_normalize_rows((csv_path, data_start, size, indices))]
+
+    # bind hot-loop lookups once
+    fields_map_get = fields_map.get
+    errors_append = errors.append
+    duplicates_add = duplicates.add
+    messages_seen_setdefault = messages_seen.setdefault
+
+    for rows in chunks:
+        for (msg_type, msg_name, tag_number, element_name, element_type,
+             required, data_type, enum_raw) in rows:
+            existing = fields_map_get(element_name)
+            if existing is not None:
+                if existing.data_type != data_type or existing.tag_number != tag_number:
+                    errors_append(
                         f"⚠️ WARNING: Tag {tag_number} defined multiple times with different name/type:\n"
-                        f"  → First:  element_name={existing['element_name']}, data_type={existing['data_type']}, tag_number={existing['tag_number']}\n"
+                        f"  → First:  element_name={element_name}, data_type={existing.data_type}, tag_number={existing.tag_number}\n"
                         f"  → Now:    element_name={element_name}, data_type={data_type}, tag_number={tag_number}"
                     )
                     continue  # skip conflicting field
-                duplicates.add(element_name)
+                duplicates_add(element_name)
             else:
-                fields_map[element_name] = {
-                    "element_type": element_type,
-                    "tag_number": tag_number,
-                    "element_name": element_name,
-                    "data_type": data_type,
-                    "enums": parse_enum_values(enum_raw, tag_number, errors)
-                }
-
-            messages[(msg_type, msg_name)].append({
-                "element_type": element_type,
-                "element_name": element_name,
-                "required": required
-            })
-
-    # XML root
-    fix = ET.Element("fix", attrib={
-        "type": "FIX",
-        "major": "4",
-        "minor": "4",
-        "servicepack": "0"
-    })
-
-    # Messages
-    messages_el = ET.SubElement(fix, "messages")
-    for (msg_type, msg_name), fields in messages.items():
-        msg_el = ET.SubElement(messages_el, "message", attrib={
-            "name": msg_name,
-            "msgtype": msg_type,
-            "msgcat": "app"
-        })
-        seen_fields = set()
-        for field in fields:
-            if field["element_name"] in seen_fields:
-                continue  # avoid duplicate field in same message
-            seen_fields.add(field["element_name"])
-            ET.SubElement(msg_el, field["element_type"], attrib={
-                "name": field["element_name"],
-                "required": field["required"]
-            })
-
-    # Fields
-    fields_el = ET.SubElement(fix, "fields")
-    for _, field in fields_map.items():
-        if field["element_type"] == "field":
-            field_el = ET.SubElement(fields_el, "field", attrib={
-                "number": field["tag_number"],
-                "name": field["element_name"],
-                "type": field["data_type"]
-            })
-            for enum_code, enum_desc in field["enums"]:
-                ET.SubElement(field_el, "value", attrib={
-                    "enum": enum_code,
-                    "description": enum_desc
-                })
-        elif field["element_type"] == "component":
-            field_el = ET.SubElement(fields_el, "component", attrib={
-                "name": field["element_name"],
-                "type": field["data_type"]
-            })
-
-    # Output XML
-    tree = ET.ElementTree(fix)
-    try:
-        ET.indent(tree, space="  ", level=0)
-    except Exception as ex:
-        print('Indent fail with exception', ex)
-
-    tree.write(output_xml_path, encoding="utf-8", xml_declaration=True)
+                fields_map[element_name] = FieldDef(
+                    element_type, tag_number, data_type,
+                    parse_enum_values(enum_raw, tag_number, errors))
+
+            # avoid duplicate field in same message, right at ingest
+            key = (msg_type, msg_name)
+            seen = messages_seen_setdefault(key, set())
+            if element_name not in seen:
+                seen.add(element_name)
+                messages[key].append((element_type, element_name, required))
+
+    # Output XML, streamed so each message/field is serialized and
+    # released immediately instead of building the whole tree first
+    with ET.xmlfile(output_xml_path, encoding="utf-8") as xf:
+        xf.write_declaration()
+        with xf.element("fix", {"type": "FIX", "major": "4",
+                                "minor": "4", "servicepack": "0"}):
+            xf.write("\n")
+
+            # Messages
+            with xf.element("messages"):
+                xf.write("\n")
+                for (msg_type, msg_name), fields in messages.items():
+                    msg_el = ET.Element("message", attrib={
+                        "name": msg_name,
+                        "msgtype": msg_type,
+                        "msgcat": "app"
+                    })
+                    for element_type, element_name, required in fields:
+                        ET.SubElement(msg_el, element_type, attrib={
+                            "name": element_name,
+                            "required": required
+                        })
+                    xf.write(msg_el, pretty_print=True)
+            xf.write("\n")
+
+            # Fields
+            with xf.element("fields"):
+                xf.write("\n")
+                for element_name, field in fields_map.items():
+                    if field.element_type == "field":
+                        field_el = ET.Element("field", attrib={
+                            "number": field.tag_number,
+                            "name": element_name,
+                            "type": field.data_type
+                        })
+                        for enum_code, enum_desc in field.enums:
+                            ET.SubElement(field_el, "value", attrib={
+                                "enum": enum_code,
+                                "description": enum_desc
+                            })
+                        xf.write(field_el, pretty_print=True)
+                    elif field.element_type == "component":
+                        field_el = ET.Element("component", attrib={
+                            "name": element_name,
+                            "type": field.data_type
+                        })
+                        xf.write(field_el, pretty_print=True)
+            xf.write("\n")
 
     print(f"✅ FIX XML generated: {output_xml_path}")
     if duplicates:
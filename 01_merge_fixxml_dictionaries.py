@@ -3,7 +3,7 @@
 - Support checking and removing duplicate tag, field.
 """
 
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 from collections import defaultdict
 
 
@@ -13,41 +13,39 @@ def merge_fix_xml(default_xml_path, custom_xml_path, output_xml_path):
     warning when there duplicate tag, field in default and custom FIX
     """
 
-    default_tree = ET.parse(default_xml_path)
-    custom_tree = ET.parse(custom_xml_path)
+    parser = ET.XMLParser(
+        huge_tree=True, remove_blank_text=True, remove_comments=True)
+    default_tree = ET.parse(default_xml_path, parser)
+    custom_tree = ET.parse(custom_xml_path, parser)
     default_root = default_tree.getroot()
     custom_root = custom_tree.getroot()
 
     default_fields = default_root.find("fields")
     custom_fields = custom_root.find("fields")
 
-    # Check duplicate in custom file
-    tag_counts = defaultdict(list)
-    for f in custom_fields.findall("field"):
-        tag = f.attrib.get("number")
-        if tag:
-            tag_counts[tag].append(f)
-
-    for tag, items in tag_counts.items():
-        if len(items) > 1:
-            print(
-                f"⚠️ Field tag {tag} is declared {len(items)} times in FIX44-CUSTOM.xml:")
-            for i, f in enumerate(items):
-                print(
-                    f"   #{i+1}: name={f.attrib.get('name')}, type={f.attrib.get('type')}")
-
-    # Merge and compare with default
+    # Index both field sections once instead of re-scanning the trees
+    custom_field_list = list(custom_fields.iter("field"))
     default_field_map = {
-        f.attrib["number"]: f for f in default_fields.findall("field")
+        f.get("number"): f for f in default_fields.iter("field")
     }
 
-    for cf in custom_fields.findall("field"):
-        num = cf.attrib["number"]
-        if num in default_field_map:
-            df = default_field_map[num]
+    # Count duplicates, compare and merge with default, all in one pass.
+    # custom_field_list stays a materialized list on purpose: appending a
+    # field to default_fields moves it out of custom_fields in lxml, which
+    # would confuse a lazy iterator over that section.
+    tag_counts = defaultdict(list)
+    for cf in custom_field_list:
+        # read each attribute once through lxml's C-level get()
+        cf_get = cf.get
+        num = cf_get("number")
+        if num:
+            tag_counts[num].append((cf_get("name"), cf_get("type")))
+        df = default_field_map.get(num)
+        if df is not None:
+            df_get = df.get
             if (
-                df.attrib.get("name") != cf.attrib.get("name")
-                or df.attrib.get("type") != cf.attrib.get("type")
+                df_get("name") != cf_get("name")
+                or df_get("type") != cf_get("type")
             ):
                 print(
                     f"⚠️ TAG {num} has same name but different type:")
@@ -56,12 +54,25 @@ def merge_fix_xml(default_xml_path, custom_xml_path, output_xml_path):
             else:
                 print(
                     f"⚠️ TAG {num} exists in default FIX (same name & type).")
-            existing_enums = {v.attrib["enum"] for v in df.findall("value")}
+            existing_enums = {v.get("enum") for v in df.iterfind("value")}
+            # findall: df.append(val) moves val out of cf mid-iteration
             for val in cf.findall("value"):
-                if val.attrib["enum"] not in existing_enums:
+                if val.get("enum") not in existing_enums:
                     df.append(val)
         else:
             default_fields.append(cf)
+            # later lookups (e.g. MsgType/35 in merge_section) must see
+            # fields that only the custom file defines
+            default_field_map[num] = cf
+
+    # Check duplicate in custom file
+    for tag, items in tag_counts.items():
+        if len(items) > 1:
+            print(
+                f"⚠️ Field tag {tag} is declared {len(items)} times in FIX44-CUSTOM.xml:")
+            for i, (f_name, f_type) in enumerate(items):
+                print(
+                    f"   #{i+1}: name={f_name}, type={f_type}")
 
      # Merge messages / components
     def merge_section(name, key_attr):
@@ -70,21 +81,32 @@ def merge_fix_xml(default_xml_path, custom_xml_path, output_xml_path):
         if c_sec is None:
             return
 
-        existing_keys = {e.attrib.get(key_attr) for e in d_sec.findall("*")}
-        for c_element in c_sec.findall("*"):
-            key = c_element.attrib.get(key_attr)
+        # key -> element index, built once instead of an XPath find per
+        # key; iterating the Element directly yields its children, and
+        # the dict's keys double as the existing-keys set
+        d_element_map = {e.get(key_attr): e for e in d_sec}
+        existing_keys = set(d_element_map)
+        d_sec_append = d_sec.append
+        # snapshot: lxml's append() moves elements out of c_sec
+        c_elements = c_sec.findall("*")
+        for c_element in c_elements:
+            key = c_element.get(key_attr)
             if key and key not in existing_keys:  # if not exist, append all element
-                d_sec.append(c_element)
+                d_sec_append(c_element)
+                # later same-named custom elements merge into this one
+                existing_keys.add(key)
+                d_element_map[key] = c_element
             else:  # if exist, we merge fields and components
-                d_element = d_sec.find(f".//{d_sec[0].tag}[@name='{key}']")
+                d_element = d_element_map.get(key)
                 d_field_map = {
-                    f.attrib["name"]: f for f in d_element.findall("field")
+                    f.get("name"): f for f in d_element.iterfind("field")
                 }
+                # findall: appending moves elements out of c_element
                 for cf in c_element.findall("field"):
                     if cf not in d_field_map:
                         d_element.append(cf)
                 d_component_map = {
-                    f.attrib["name"]: f for f in d_element.findall("component")
+                    f.get("name"): f for f in d_element.iterfind("component")
                 }
                 for cc in c_element.findall("component"):
                     if cc not in d_component_map:
@@ -92,26 +114,25 @@ def merge_fix_xml(default_xml_path, custom_xml_path, output_xml_path):
 
         # For messages, we need to add more MsgType enum
         if name == "messages":
-            msg_type_field = default_root.find(".//field[@number='35']")
-            for msg in c_sec:
+            msg_type_field = default_field_map.get("35")
+            existing_msg_enums = {
+                v.get("enum") for v in msg_type_field.iterfind("value")
+            }
+            for msg in c_elements:
                 enum = msg.get("msgtype")
                 description = msg.get("name").upper()
 
                 # Check if this value already exists
-                exists = msg_type_field.find(f"./value[@enum='{enum}']")
-                if exists is None:
+                if enum not in existing_msg_enums:
+                    existing_msg_enums.add(enum)
                     ET.SubElement(msg_type_field, "value",
                                   enum=enum, description=description)
 
     merge_section("messages", "name")
     merge_section("components", "name")
 
-    try:
-        ET.indent(default_tree, space="  ", level=0)
-    except Exception as ex:
-        print('Indent fail with exception', ex)
-
-    default_tree.write(output_xml_path, encoding="utf-8", xml_declaration=True)
+    default_tree.write(output_xml_path, encoding="utf-8",
+                       xml_declaration=True, pretty_print=True)
     print(f"✅ Merged FIX dictionary into: {output_xml_path}")
 
 
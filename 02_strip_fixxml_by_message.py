@@ -3,8 +3,12 @@
 - Remove all messages (including components and fields) which are not in list.
 """
 
-import xml.etree.ElementTree as ET
-import json
+from lxml import etree as ET
+
+try:
+    from orjson import loads as json_loads  # C/Rust fast path
+except ImportError:
+    from json import loads as json_loads
 
 
 def strip_fix_xml(fix_xml_path, config_path, output_path):
@@ -12,78 +16,134 @@ def strip_fix_xml(fix_xml_path, config_path, output_path):
     strip fix sml
     """
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    # read as bytes so the parser skips Python's text-mode decoding
+    with open(config_path, 'rb') as f:
+        config = json_loads(f.read())
 
-    messages_to_keep = {(m) for m in config["messages_to_keep"]}
+    messages_to_keep = frozenset(config["messages_to_keep"])
     used_field_names = set()
     used_components = set()
     visited_components = set()
 
-    # Load and parse FIX XML
-    tree = ET.parse(fix_xml_path)
-    root = tree.getroot()
-
-    messages_el = root.find("messages")
-    fields_el = root.find("fields")
-    components_el = root.find("components")
-    header_el = root.find("header")
-    trailer_el = root.find("trailer")
-
-    component_map = {
-        c.attrib["name"]: c for c in components_el} if components_el is not None else {}
-
-    def collect_nested_components(name):
-        if name in visited_components or name not in component_map:
-            return
-        visited_components.add(name)
-        used_components.add(name)
-        comp = component_map[name]
-        collect_fields_groups_components(comp)
+    # name -> (field names, group names, referenced component names)
+    component_map = {}
 
     def collect_fields_groups_components(elem):
-        for f in elem.findall("field"):
-            used_field_names.add(f.attrib["name"])
-        for g in elem.findall("group"):
-            used_field_names.add(g.attrib["name"])
-            collect_fields_groups_components(g)
-        for c in elem.findall("component"):
-            cname = c.attrib["name"]
-            collect_nested_components(cname)
-
-    # Collect from message
-    for msg in list(messages_el):
-        msgtype = msg.attrib.get("msgtype")
-        if (msgtype) not in messages_to_keep:
-            messages_el.remove(msg)
-        else:
-            collect_fields_groups_components(msg)
-
-    # Collect from header and trailer
-    for section in [header_el, trailer_el]:
-        if section is not None:
-            collect_fields_groups_components(section)
-
-    if components_el:
-        for comp in list(components_el):
-            if comp.attrib["name"] not in used_components:
-                components_el.remove(comp)
-
-    # Remove unused fields
-    for field in list(fields_el):
-        if field.attrib["name"] not in used_field_names:
-            fields_el.remove(field)
-
-    # Save output
-    try:
-        ET.indent(tree, space="  ", level=0)  # Python 3.9+
-    except Exception as ex:
-        print('Indent fail with exception', ex)
-
-    tree.write(output_path, encoding="utf-8", xml_declaration=True)
+        # iter() walks nested groups too; referenced component names are
+        # returned so the caller can resolve them without recursion
+        used_add = used_field_names.add
+        for f in elem.iter("field"):
+            used_add(f.get("name"))
+        for g in elem.iter("group"):
+            used_add(g.get("name"))
+        return [c.get("name") for c in elem.iter("component")]
+
+    def collect_components(names):
+        stack = list(names)
+        while stack:
+            name = stack.pop()
+            if name in visited_components or name not in component_map:
+                continue
+            visited_components.add(name)
+            used_components.add(name)
+            fields, groups, refs = component_map[name]
+            used_field_names.update(fields)
+            used_field_names.update(groups)
+            stack.extend(refs)
+
+    def release(elem):
+        # free the processed subtree and its already-cleared siblings so
+        # the working set stays bounded while streaming
+        parent = elem.getparent()
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+    # Pass 1: stream the FIX XML and collect what the kept messages use
+    pending_components = []
+    depth = 0
+    context = ET.iterparse(fix_xml_path, events=("start", "end"),
+                           huge_tree=True, remove_comments=True)
+    for event, elem in context:
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1:
+            # direct child of root: header/trailer are kept entirely
+            if elem.tag in ("header", "trailer"):
+                pending_components += collect_fields_groups_components(elem)
+            release(elem)
+        elif depth == 2:
+            parent_tag = elem.getparent().tag
+            if parent_tag in ("header", "trailer"):
+                continue  # collected with their whole section at depth 1
+            if parent_tag == "messages":
+                if elem.get("msgtype") in messages_to_keep:
+                    pending_components += collect_fields_groups_components(
+                        elem)
+            elif parent_tag == "components":
+                fields = {f.get("name") for f in elem.iter("field")}
+                groups = {g.get("name") for g in elem.iter("group")}
+                refs = [c.get("name")
+                        for c in elem.iter("component") if c is not elem]
+                component_map[elem.get("name")] = (fields, groups, refs)
+            release(elem)
+
+    collect_components(pending_components)
+
+    # freeze the keep-sets for the membership tests in the filter pass
+    used_field_names = frozenset(used_field_names)
+    used_components = frozenset(used_components)
+
+    # Pass 2: stream again and emit only the kept elements
+    messages_kept = 0
+    depth = 0
+    section_tag = None
+    root_ctx = None
+    section_ctx = None
+    context = ET.iterparse(fix_xml_path, events=("start", "end"),
+                           huge_tree=True, remove_comments=True,
+                           remove_blank_text=True)
+    with ET.xmlfile(output_path, encoding="utf-8") as xf:
+        xf.write_declaration()
+        for event, elem in context:
+            if event == "start":
+                if depth == 0:
+                    root_ctx = xf.element(elem.tag, dict(elem.attrib))
+                    root_ctx.__enter__()
+                    xf.write("\n")
+                elif depth == 1:
+                    section_tag = elem.tag
+                    section_ctx = xf.element(elem.tag, dict(elem.attrib))
+                    section_ctx.__enter__()
+                    xf.write("\n")
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 2:
+                if section_tag == "messages":
+                    keep = elem.get("msgtype") in messages_to_keep
+                    messages_kept += keep
+                elif section_tag == "components":
+                    keep = elem.get("name") in used_components
+                elif section_tag == "fields":
+                    keep = elem.get("name") in used_field_names
+                else:
+                    keep = True
+                if keep:
+                    xf.write(elem, pretty_print=True)
+                release(elem)
+            elif depth == 1:
+                section_ctx.__exit__(None, None, None)
+                xf.write("\n")
+                release(elem)
+            elif depth == 0:
+                root_ctx.__exit__(None, None, None)
+
     print(f"✅ FIX XML saved to: {output_path}")
     print(
-        f"✅ Messages kept: {len(messages_el)}, Fields kept: {len(used_field_names)}, Components kept: {len(used_components)}")
+        f"✅ Messages kept: {messages_kept}, Fields kept: {len(used_field_names)}, Components kept: {len(used_components)}")
 
 
 FIX_XML_PATH = "data/FIX-MERGED.xml"
@@ -0,0 +1,60 @@
+# cython: language_level=3
+"""
+- C fast path for parse_enum_values in 00_csv_to_fixxml.py.
+- Build in place with: python setup.py build_ext --inplace
+"""
+
+from libc.string cimport memchr
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
+
+cdef inline bint _is_space(char c):
+    return c == c' ' or c == c'\t' or c == c'\r' or c == c'\n'
+
+
+cdef inline object _decode_stripped(const char *buf, Py_ssize_t start, Py_ssize_t end):
+    # trim the common ASCII whitespace in C, then let str.strip() drop
+    # any remaining Unicode whitespace (NBSP, \x0b, ...) so the result
+    # is identical whether or not this extension is built
+    while start < end and _is_space(buf[start]):
+        start += 1
+    while end > start and _is_space(buf[end - 1]):
+        end -= 1
+    return PyUnicode_DecodeUTF8(buf + start, end - start, NULL).strip()
+
+
+cpdef list parse_enum_values(enum_str, tag_number, list errors):
+    """
+    parse enum values (enum_value:description), scanning the utf-8
+    bytes with memchr instead of chained Python-level splits
+    """
+    cdef list enum_list = []
+    if not enum_str:
+        return enum_list
+
+    cdef bytes data = enum_str.strip().encode("utf-8")
+    cdef const char *buf = data
+    cdef Py_ssize_t n = len(data)
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t bar, colon
+    cdef const char *p
+    cdef const char *q
+
+    while True:
+        p = <const char *>memchr(buf + pos, c'|', n - pos)
+        bar = (p - buf) if p is not NULL else n
+        q = <const char *>memchr(buf + pos, c':', bar - pos)
+        if q is NULL:
+            errors.append(
+                f"❌ ERROR: Invalid enum format for tag {tag_number}: "
+                f"'{PyUnicode_DecodeUTF8(buf + pos, bar - pos, NULL)}' (missing ':')")
+        else:
+            colon = q - buf
+            enum_list.append((
+                _decode_stripped(buf, pos, colon),
+                _decode_stripped(buf, colon + 1, bar),
+            ))
+        if bar == n:
+            break
+        pos = bar + 1
+    return enum_list
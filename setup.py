@@ -0,0 +1,16 @@
+"""
+Build the optional compiled enum parser:
+
+    python setup.py build_ext --inplace
+
+The scripts fall back to the pure-Python parser when the extension
+is not compiled.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="fix_utilities",
+    ext_modules=cythonize("_enum_parse.pyx", language_level="3"),
+)